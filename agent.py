@@ -38,7 +38,7 @@ import termios
 def _run_cmd(*cmd) -> bool:
     """Run a command silently. Returns True on success."""
     try:
-        r = subprocess.run(list(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        r = subprocess.run(list(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return r.returncode == 0
     except FileNotFoundError:
         return False
@@ -221,6 +221,29 @@ _ensure_websockets()
 import websockets  # noqa: E402
 from websockets.exceptions import ConnectionClosed  # noqa: E402
 
+try:
+    import orjson  # noqa: E402  (optional speedup, never auto-installed)
+except ImportError:
+    orjson = None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# JSON codec — orjson when available, stdlib json otherwise
+# ──────────────────────────────────────────────────────────────────────────────
+
+if orjson is not None:
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# PTY output goes up as binary frames: this tag byte, then the raw bytes
+FRAME_OUTPUT = b"\x01"
+_PONG_JSON   = _dumps({"type": "pong"})
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # PTY helpers
@@ -254,7 +277,7 @@ async def _run_session(ws: websockets.WebSocketClientProtocol, server_url: str)
 
     rows, cols = _get_terminal_size()
 
-    await ws.send(json.dumps({
+    await ws.send(_dumps({
         "type":  "register",
         "name":  socket.gethostname(),
         "shell": os.environ.get("SHELL", "/bin/bash"),
@@ -263,7 +286,7 @@ async def _run_session(ws: websockets.WebSocketClientProtocol, server_url: str)
     }))
 
     raw = await asyncio.wait_for(ws.recv(), timeout=10.0)
-    msg = json.loads(raw)
+    msg = _loads(raw)
     if msg.get("type") != "session":
         raise RuntimeError(f"Unexpected server response: {msg}")
 
@@ -295,8 +318,7 @@ async def _run_session(ws: websockets.WebSocketClientProtocol, server_url: str)
                 data = await loop.run_in_executor(None, lambda: os.read(fd, 8192))
                 if not data:
                     break
-                await ws.send(json.dumps({"type": "output",
-                                          "data": data.decode("utf-8", errors="replace")}))
+                await ws.send(FRAME_OUTPUT + data)
             except (OSError, ConnectionClosed):
                 break
         done.set()
@@ -306,13 +328,13 @@ async def _run_session(ws: websockets.WebSocketClientProtocol, server_url: str)
             if done.is_set():
                 break
             try:
-                m = json.loads(raw_msg)
+                m = _loads(raw_msg)
                 if m["type"] == "input":
                     os.write(fd, m["data"].encode())
                 elif m["type"] == "resize":
                     _set_terminal_size(fd, int(m.get("rows", rows)), int(m.get("cols", cols)))
                 elif m["type"] == "ping":
-                    await ws.send(json.dumps({"type": "pong"}))
+                    await ws.send(_PONG_JSON)
             except (OSError, ConnectionClosed):
                 break
         done.set()
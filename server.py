@@ -13,7 +13,7 @@ Flow:
                       └─► bidirectional PTY relay
 
 Usage:
-  pip install fastapi uvicorn
+  pip install -r requirements.txt
   python server.py                         # default 0.0.0.0:8000
   python server.py --host 0.0.0.0 --port 9000
 """
@@ -22,28 +22,78 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
+import os
 import pathlib
+import secrets
 import socket
+import sys
 import time
-import uuid
+import unicodedata
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
+from fastapi.staticfiles import StaticFiles
 from starlette.requests import Request
 
+try:
+    import orjson                     # optional C serializer for the relay hot path
+except ImportError:                   # pragma: no cover - stdlib fallback
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 SCROLLBACK_BYTES = 64 * 1024          # 64 KB rolling buffer per session
 SESSION_TTL_AFTER_DISCONNECT = 120    # seconds before dead session is pruned
+OUTPUT_FLUSH_DELAY = 0.003            # coalesce PTY output for up to 3 ms …
+OUTPUT_FLUSH_BYTES = 64 * 1024        # … or until this much is pending
+
+# Binary WebSocket frames carry raw PTY bytes behind a 1-byte type tag;
+# control messages stay JSON text frames.
+FRAME_OUTPUT = b"\x01"
+
+HERE       = pathlib.Path(__file__).parent
+STATIC_DIR = HERE / "static"          # dashboard + assets, served as files
+
+# agent.py is immutable for the life of the process: read it once at import
+_AGENT_PATH  = HERE / "agent.py"
+_AGENT_BYTES = _AGENT_PATH.read_bytes() if _AGENT_PATH.exists() else None
 
-HERE = pathlib.Path(__file__).parent
+# Dashboard assets are served as <stem>.<sha256[:8]>.<ext>, with the digest
+# computed from the file at import, so those URLs never change in place
+ASSETS_DIR      = STATIC_DIR / "assets"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# ---------------------------------------------------------------------------
+# JSON codec (orjson when installed, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+if orjson is not None:
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+
+    _dumpb = orjson.dumps                 # bytes, for HTTP response bodies
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+
+    def _dumpb(payload: dict) -> bytes:
+        return json.dumps(payload).encode()
+
+    _loads = json.loads
+
+# Control frames that never change shape, serialised once at import
+_PING_JSON = _dumps({"type": "ping"})
+_PONG_JSON = _dumps({"type": "pong"})
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -55,56 +105,151 @@ class Session:
     name:     str
     created:  float = field(default_factory=time.time)
     agent:    Optional[WebSocket] = None
-    viewers:  set[WebSocket]      = field(default_factory=set)
-    buf:      bytearray           = field(default_factory=bytearray)
+    viewers:  tuple[WebSocket, ...] = ()  # replaced, never mutated in place
+    buf:      bytearray           = field(default_factory=lambda: bytearray(SCROLLBACK_BYTES))
+    buf_pos:  int                 = 0      # next write offset into the ring
+    buf_full: bool                = False  # ring has wrapped at least once
     cols:     int                 = 220
     rows:     int                 = 50
     alive:    bool                = True
+    _meta:    tuple               = field(default=(None, ""), repr=False)
+    pending:  bytearray           = field(default_factory=bytearray, repr=False)
+    _flusher: Optional[asyncio.Task] = field(default=None, repr=False)
 
     # ------------------------------------------------------------------
     # Buffer helpers
     # ------------------------------------------------------------------
 
-    def append_output(self, text: str) -> None:
-        """Append PTY output to the scrollback buffer, trimming if needed."""
-        chunk = text.encode("utf-8", errors="replace")
-        self.buf.extend(chunk)
-        overflow = len(self.buf) - SCROLLBACK_BYTES
-        if overflow > 0:
-            del self.buf[:overflow]
+    def append_output(self, data: bytes | memoryview) -> None:
+        """Append raw PTY output to the fixed-size scrollback ring buffer."""
+        chunk = memoryview(data)
+        size  = SCROLLBACK_BYTES
+        n     = len(chunk)
+        if n >= size:
+            self.buf[:]   = chunk[n - size:]
+            self.buf_pos  = 0
+            self.buf_full = True
+            return
 
-    def scrollback_text(self) -> str:
-        return self.buf.decode("utf-8", errors="replace")
+        pos = self.buf_pos
+        end = pos + n
+        if end <= size:
+            self.buf[pos:end] = chunk
+        else:
+            head = size - pos
+            self.buf[pos:] = chunk[:head]
+            self.buf[:n - head] = chunk[head:]
+        if end >= size:
+            self.buf_full = True
+        self.buf_pos = end % size
+
+    @property
+    def has_scrollback(self) -> bool:
+        return self.buf_full or self.buf_pos > 0
+
+    def scrollback_tail(self, limit: int = SCROLLBACK_BYTES) -> bytes:
+        """Return at most the last `limit` bytes of scrollback.
+
+        The cut is moved forward past any UTF-8 continuation bytes so the
+        replay never starts in the middle of a character.
+        """
+        pos   = self.buf_pos
+        total = SCROLLBACK_BYTES if self.buf_full else pos
+        n     = min(limit, total)
+        start = pos - n
+        if start >= 0:
+            data = bytes(self.buf[start:pos])
+        else:
+            data = bytes(self.buf[start:] + self.buf[:pos])
+        skip = 0
+        while skip < min(3, len(data)) and 0x80 <= data[skip] <= 0xBF:
+            skip += 1
+        return data[skip:] if skip else data
 
     # ------------------------------------------------------------------
     # Broadcast helpers
     # ------------------------------------------------------------------
 
+    async def queue_output(self, data: bytes) -> None:
+        """Buffer PTY output and broadcast it in one frame per short window."""
+        self.pending += data
+        if len(self.pending) >= OUTPUT_FLUSH_BYTES:
+            await self.flush_output()
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(OUTPUT_FLUSH_DELAY)
+        # Output queued while a broadcast is in flight sees this task as
+        # still running and schedules nothing, so drain it here
+        while self.pending:
+            await self.flush_output()
+
+    async def flush_output(self) -> None:
+        """Move pending output into scrollback and send it to all viewers."""
+        if not self.pending:
+            return
+        # One allocation per flush: the frame is built straight from the
+        # reusable pending buffer and the same bytes object goes to every
+        # viewer; scrollback reads the payload through a memoryview.
+        frame = FRAME_OUTPUT + self.pending
+        self.pending.clear()
+        self.append_output(memoryview(frame)[1:])
+        await self.broadcast_raw(frame)
+
     async def broadcast_to_viewers(self, payload: dict) -> None:
         """Send a JSON message to every viewer; drop dead connections."""
-        raw = json.dumps(payload)
-        dead: set[WebSocket] = set()
-        for ws in list(self.viewers):
-            try:
-                await ws.send_text(raw)
-            except Exception:
-                dead.add(ws)
-        self.viewers -= dead
-
-    async def send_to_agent(self, payload: dict) -> bool:
-        """Forward a message to the agent. Returns False if agent is gone."""
+        await self.broadcast_raw(_dumps(payload))
+
+    async def broadcast_raw(self, raw: str | bytes) -> None:
+        """Send an already-serialised frame (text or binary) to every viewer.
+
+        Sends run concurrently so one slow viewer does not hold up the rest.
+        """
+        viewers = self.viewers                # immutable, so no snapshot copy
+        if isinstance(raw, bytes):
+            sends = (ws.send_bytes(raw) for ws in viewers)
+        else:
+            sends = (ws.send_text(raw) for ws in viewers)
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        dead = {ws for ws, r in zip(viewers, results) if isinstance(r, Exception)}
+        if dead:
+            # Filter the current tuple so viewers that joined mid-send stay
+            self.viewers = tuple(ws for ws in self.viewers if ws not in dead)
+
+    def add_viewer(self, ws: WebSocket) -> None:
+        self.viewers += (ws,)
+
+    def remove_viewer(self, ws: WebSocket) -> None:
+        self.viewers = tuple(v for v in self.viewers if v is not ws)
+
+    async def send_to_agent(self, payload: dict | str) -> bool:
+        """Forward a message (dict or pre-serialised JSON) to the agent.
+
+        Returns False if the agent is gone.
+        """
         if not self.agent or not self.alive:
             return False
+        raw = payload if isinstance(payload, str) else _dumps(payload)
         try:
-            await self.agent.send_text(json.dumps(payload))
+            await self.agent.send_text(raw)
             return True
         except Exception:
             return False
 
     # ------------------------------------------------------------------
-    # Serialise for the REST API
+    # Serialise for viewers / the REST API
     # ------------------------------------------------------------------
 
+    def meta_json(self) -> str:
+        """Serialised meta frame, rebuilt only when name/size/viewers change."""
+        key = (self.name, len(self.viewers), self.cols, self.rows)
+        cached_key, raw = self._meta
+        if key != cached_key:
+            raw = _dumps(_meta_payload(self))
+            self._meta = (key, raw)
+        return raw
+
     def to_dict(self) -> dict:
         return {
             "id":      self.id,
@@ -114,6 +259,29 @@ class Session:
             "viewers": len(self.viewers),
         }
 
+
+@dataclass
+class Registration:
+    """Validated agent handshake: {"type": "register", name, rows, cols}."""
+    name: str = "unknown"
+    rows: int = 50
+    cols: int = 220
+
+    @classmethod
+    def parse(cls, raw: str) -> Optional[Registration]:
+        """Decode and validate in one pass; None if the frame is unusable."""
+        msg = _parse_json(raw)
+        if msg is None or msg.get("type") != "register":
+            return None
+        try:
+            return cls(
+                name=str(msg.get("name", cls.name)),
+                rows=int(msg.get("rows", cls.rows)),
+                cols=int(msg.get("cols", cls.cols)),
+            )
+        except (TypeError, ValueError):
+            return None
+
 # ---------------------------------------------------------------------------
 # Session registry
 # ---------------------------------------------------------------------------
@@ -122,7 +290,9 @@ _sessions: dict[str, Session] = {}
 
 
 def create_session(name: str, rows: int, cols: int) -> Session:
-    sid = uuid.uuid4().hex[:10]
+    sid = secrets.token_hex(5)
+    while sid in _sessions:               # 1 in 2**40; just draw again
+        sid = secrets.token_hex(5)
     sess = Session(id=sid, name=name, rows=rows, cols=cols)
     _sessions[sid] = sess
     return sess
@@ -132,13 +302,14 @@ def get_session(sid: str) -> Optional[Session]:
     return _sessions.get(sid)
 
 
-def all_sessions() -> list[Session]:
-    return list(_sessions.values())
+def all_sessions() -> Iterable[Session]:
+    # A live view, not a copy: callers iterate it without awaiting
+    return _sessions.values()
 
 
 def schedule_prune(sid: str) -> None:
     """Remove a dead session after TTL seconds."""
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     loop.call_later(SESSION_TTL_AFTER_DISCONNECT, lambda: _sessions.pop(sid, None))
 
 # ---------------------------------------------------------------------------
@@ -153,6 +324,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # ---------------------------------------------------------------------------
 # Utility: derive server base URL from request
@@ -177,28 +349,24 @@ async def route_installer(request: Request) -> PlainTextResponse:
 @app.get("/agent.py", response_class=PlainTextResponse, include_in_schema=False)
 async def route_agent_script() -> PlainTextResponse:
     """Serve the agent Python script so the installer can download it."""
-    agent_path = HERE / "agent.py"
-    if not agent_path.exists():
+    if _AGENT_BYTES is None:
         raise HTTPException(status_code=404, detail="agent.py not found next to server.py")
-    return PlainTextResponse(agent_path.read_text(), media_type="text/plain")
+    return PlainTextResponse(_AGENT_BYTES, media_type="text/plain")
 
 # ---------------------------------------------------------------------------
 # Routes: REST API
 # ---------------------------------------------------------------------------
 
 @app.get("/api/sessions")
-async def route_list_sessions() -> dict:
-    return {"sessions": [s.to_dict() for s in all_sessions()]}
+async def route_list_sessions() -> Response:
+    # Serialise directly instead of going through FastAPI's jsonable_encoder
+    body = _dumpb({"sessions": [s.to_dict() for s in all_sessions()]})
+    return Response(body, media_type="application/json")
 
 # ---------------------------------------------------------------------------
 # Routes: HTML pages
 # ---------------------------------------------------------------------------
 
-@app.get("/", response_class=HTMLResponse)
-async def route_dashboard() -> HTMLResponse:
-    return HTMLResponse(_DASHBOARD_HTML)
-
-
 @app.get("/s/{sid}", response_class=HTMLResponse)
 async def route_viewer_page(sid: str) -> HTMLResponse:
     if not get_session(sid):
@@ -210,6 +378,22 @@ async def route_viewer_page(sid: str) -> HTMLResponse:
 # WebSocket: agent
 # ---------------------------------------------------------------------------
 
+async def _agent_output(sess: Session, msg: dict, ws: WebSocket) -> None:
+    # JSON output from agents predating binary frames
+    await sess.queue_output(msg["data"].encode("utf-8", errors="replace"))
+
+
+async def _agent_pong(sess: Session, msg: dict, ws: WebSocket) -> None:
+    await sess.broadcast_raw(_PONG_JSON)
+
+
+# Text-frame handlers keyed by message "type"; unknown types are ignored
+_AGENT_HANDLERS = {
+    "output": _agent_output,
+    "pong":   _agent_pong,
+}
+
+
 @app.websocket("/agent/ws")
 async def ws_agent(websocket: WebSocket) -> None:
     await websocket.accept()
@@ -217,24 +401,19 @@ async def ws_agent(websocket: WebSocket) -> None:
 
     try:
         # Step 1 ── registration handshake
-        raw  = await asyncio.wait_for(websocket.receive_text(), timeout=10.0)
-        msg  = json.loads(raw)
-
-        if msg.get("type") != "register":
+        raw = await asyncio.wait_for(websocket.receive_text(), timeout=10.0)
+        reg = Registration.parse(raw)
+        if reg is None:
             await websocket.close(code=4000)
             return
 
-        sess = create_session(
-            name=msg.get("name", "unknown"),
-            rows=int(msg.get("rows", 50)),
-            cols=int(msg.get("cols", 220)),
-        )
+        sess = create_session(name=reg.name, rows=reg.rows, cols=reg.cols)
         sess.agent = websocket
 
         # Reply with session info
         # Note: we embed __SERVER__ as placeholder; agent replaces it using
         # the --server flag value it already knows.
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(_dumps({
             "type": "session",
             "sid":  sess.id,
             "url":  f"__SERVER__/s/{sess.id}",
@@ -243,17 +422,26 @@ async def ws_agent(websocket: WebSocket) -> None:
         print(f"[agent +] {sess.name!r}  sid={sess.id}")
 
         # Step 2 ── relay loop
-        async for raw_msg in websocket.iter_text():
-            msg = _parse_json(raw_msg)
-            if not msg:
+        queue_output = sess.queue_output
+        handlers     = _AGENT_HANDLERS
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            frame = message.get("bytes")
+            if frame is not None:
+                # Binary output frame: raw PTY bytes, no decoding needed
+                if frame[:1] == FRAME_OUTPUT:
+                    await queue_output(frame[1:])
                 continue
 
-            if msg["type"] == "output":
-                sess.append_output(msg["data"])
-                await sess.broadcast_to_viewers({"type": "output", "data": msg["data"]})
-
-            elif msg["type"] == "pong":
-                await sess.broadcast_to_viewers({"type": "pong"})
+            msg = _parse_json(message.get("text") or "")
+            if not msg:
+                continue
+            handler = handlers.get(msg.get("type"))
+            if handler:
+                await handler(sess, msg, websocket)
 
     except (WebSocketDisconnect, asyncio.TimeoutError):
         pass
@@ -268,69 +456,137 @@ async def ws_agent(websocket: WebSocket) -> None:
 # WebSocket: viewer
 # ---------------------------------------------------------------------------
 
+async def _viewer_ping(sess: Session, msg: dict, ws: WebSocket) -> None:
+    # Forward to agent; agent replies with pong which we relay
+    if not await sess.send_to_agent(_PING_JSON):
+        # Agent gone — reply directly so viewer latency still works
+        await ws.send_text(_PONG_JSON)
+
+
+async def _viewer_input(sess: Session, msg: dict, ws: WebSocket) -> None:
+    await sess.send_to_agent(msg)
+
+
+async def _viewer_resize(sess: Session, msg: dict, ws: WebSocket) -> None:
+    sess.cols = int(msg.get("cols", sess.cols))
+    sess.rows = int(msg.get("rows", sess.rows))
+    await sess.send_to_agent(msg)
+    await sess.broadcast_raw(sess.meta_json())
+
+
+_VIEWER_HANDLERS = {
+    "ping":   _viewer_ping,
+    "input":  _viewer_input,
+    "resize": _viewer_resize,
+}
+
+
 @app.websocket("/viewer/ws/{sid}")
 async def ws_viewer(websocket: WebSocket, sid: str) -> None:
     await websocket.accept()
 
     sess = get_session(sid)
     if not sess:
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(_dumps({
             "type":    "error",
             "message": f"Session '{sid}' not found or expired.",
         }))
         await websocket.close()
         return
 
-    # Replay scrollback so the viewer sees existing output
-    if sess.buf:
-        await websocket.send_text(json.dumps({
-            "type": "output",
-            "data": sess.scrollback_text(),
-        }))
+    # Replay roughly one screenful of scrollback (worst-case 4 UTF-8 bytes
+    # per cell); older history would scroll straight off the viewer anyway.
+    if sess.has_scrollback:
+        tail = sess.scrollback_tail(sess.rows * sess.cols * 4)
+        await websocket.send_bytes(FRAME_OUTPUT + tail)
 
     # Send current metadata
-    await websocket.send_text(json.dumps(_meta_payload(sess)))
+    await websocket.send_text(sess.meta_json())
 
-    sess.viewers.add(websocket)
+    sess.add_viewer(websocket)
     print(f"[view  +] sid={sid}  total={len(sess.viewers)}")
 
+    handlers = _VIEWER_HANDLERS
     try:
         async for raw_msg in websocket.iter_text():
             msg = _parse_json(raw_msg)
             if not msg:
                 continue
-
-            if msg["type"] == "ping":
-                # Forward to agent; agent replies with pong which we relay
-                if not await sess.send_to_agent({"type": "ping"}):
-                    # Agent gone — reply directly so viewer latency still works
-                    await websocket.send_text(json.dumps({"type": "pong"}))
-
-            elif msg["type"] == "input":
-                await sess.send_to_agent(msg)
-
-            elif msg["type"] == "resize":
-                sess.cols = int(msg.get("cols", sess.cols))
-                sess.rows = int(msg.get("rows", sess.rows))
-                await sess.send_to_agent(msg)
-                await sess.broadcast_to_viewers(_meta_payload(sess))
+            handler = handlers.get(msg.get("type"))
+            if handler:
+                await handler(sess, msg, websocket)
 
     except (WebSocketDisconnect, Exception):
         pass
 
     finally:
-        sess.viewers.discard(websocket)
+        sess.remove_viewer(websocket)
         print(f"[view  -] sid={sid}  total={len(sess.viewers)}")
 
+# ---------------------------------------------------------------------------
+# Static frontend (mounted last so it never shadows the routes above)
+# ---------------------------------------------------------------------------
+
+def _fingerprint_assets() -> dict[str, str]:
+    """Map each asset's URL path to its content-hashed URL path."""
+    urls = {}
+    for path in sorted(ASSETS_DIR.glob("*")):
+        if path.suffix in (".css", ".js"):
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()[:8]
+            urls[f"/assets/{path.name}"] = f"/assets/{path.stem}.{digest}{path.suffix}"
+    return urls
+
+
+_ASSET_URLS = _fingerprint_assets()
+
+# Hashed name (as StaticFiles sees the path) → the file actually on disk
+_HASHED_ASSETS = {
+    os.path.join(*hashed.split("/")[1:]): os.path.join(*plain.split("/")[1:])
+    for plain, hashed in _ASSET_URLS.items()
+}
+
+
+def _render_index() -> bytes:
+    html = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+    for plain, hashed in _ASSET_URLS.items():
+        html = html.replace(f'"{plain}"', f'"{hashed}"')
+    return html.encode()
+
+
+_INDEX_BYTES = _render_index()
+
+
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def route_dashboard() -> HTMLResponse:
+    # Always revalidated, so a new asset digest is picked up on the next load
+    return HTMLResponse(_INDEX_BYTES, headers={"Cache-Control": "no-cache"})
+
+
+class StaticSite(StaticFiles):
+    """StaticFiles that serves fingerprinted asset names, cached forever."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        plain = _HASHED_ASSETS.get(path)
+        if plain is None:
+            return await super().get_response(path, scope)
+        response = await super().get_response(plain, scope)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        return response
+
+
+app.mount("/", StaticSite(directory=STATIC_DIR, html=True), name="static")
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 def _parse_json(raw: str) -> Optional[dict]:
+    """Decode a control frame; None unless it is a JSON object."""
     try:
-        return json.loads(raw)
+        msg = _loads(raw)
     except Exception:
         return None
+    return msg if isinstance(msg, dict) else None
 
 
 def _meta_payload(sess: Session) -> dict:
@@ -347,19 +603,25 @@ def _mark_agent_disconnected(sess: Session) -> None:
     sess.alive = False
     sess.agent = None
     print(f"[agent -] {sess.name!r}  sid={sess.id}")
-    asyncio.get_event_loop().create_task(
-        sess.broadcast_to_viewers({
-            "type":    "disconnect",
-            "message": f"Agent '{sess.name}' disconnected",
-        })
-    )
+    asyncio.create_task(_announce_disconnect(sess))
     schedule_prune(sess.id)
 
+
+async def _announce_disconnect(sess: Session) -> None:
+    # Flush first so viewers see the agent's last output before the notice
+    await sess.flush_output()
+    await sess.broadcast_to_viewers({
+        "type":    "disconnect",
+        "message": f"Agent '{sess.name}' disconnected",
+    })
+
 # ---------------------------------------------------------------------------
-# Shell installer script (generated dynamically with server URL baked in)
+# Shell installer script (rendered per server URL, then cached)
 # ---------------------------------------------------------------------------
 
-def _render_installer(server_url: str) -> str:
+@lru_cache(maxsize=16)
+def _render_installer(server_url: str) -> bytes:
+    """Render (and memoise) the installer, pre-encoded for the response."""
     return f"""\
 #!/bin/sh
 # HyprShare — agent installer
@@ -404,270 +666,11 @@ echo ""
 echo "  Start a session:"
 echo "    $PYTHON $BINARY --server $SERVER_URL"
 echo ""
-"""
+""".encode()
 
 # ---------------------------------------------------------------------------
-# HTML templates (kept as module-level constants; real projects use Jinja2)
-# ---------------------------------------------------------------------------
-
-_DASHBOARD_HTML = """\
-<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>HyprShare — Dashboard</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com" />
-  <link rel="stylesheet"
-    href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;700&display=swap" />
-  <style>
-    /* ── reset ── */
-    *, *::before, *::after { margin: 0; padding: 0; box-sizing: border-box; }
-
-    /* ── design tokens ── */
-    :root {
-      --bg:      #1e1e2e;
-      --surface: rgba(30, 30, 46, 0.75);
-      --border:  rgba(203, 166, 247, 0.2);
-      --mauve:   #cba6f7;
-      --blue:    #89b4fa;
-      --green:   #a6e3a1;
-      --red:     #f38ba8;
-      --text:    #cdd6f4;
-      --sub:     #a6adc8;
-      --muted:   #6c7086;
-      --blur:    blur(22px) saturate(180%);
-      --radius:  10px;
-    }
-
-    /* ── base ── */
-    html, body {
-      min-height: 100vh;
-      background: var(--bg);
-      color: var(--text);
-      font-family: "JetBrains Mono", monospace;
-    }
-
-    /* ── wallpaper ── */
-    #bg {
-      position: fixed; inset: 0; z-index: 0;
-      background: radial-gradient(ellipse at 30% 40%, #1e1e3e, #0d0d1a 60%, #1a0d2e);
-    }
-
-    /* ── layout ── */
-    main {
-      position: relative; z-index: 1;
-      max-width: 860px; margin: 0 auto; padding: 64px 24px;
-    }
-
-    /* ── header ── */
-    .logo    { font-size: 28px; font-weight: 700; color: var(--mauve); letter-spacing: .06em; }
-    .tagline { font-size: 13px; color: var(--muted); margin: 4px 0 44px; }
-
-    /* ── section title ── */
-    h2 {
-      font-size: 11px; font-weight: 600; color: var(--sub);
-      letter-spacing: .12em; text-transform: uppercase;
-      border-bottom: 1px solid var(--border);
-      padding-bottom: 8px; margin-bottom: 14px;
-    }
-
-    /* ── quick-start box ── */
-    .quickstart {
-      background: var(--surface);
-      backdrop-filter: var(--blur);
-      border: 1px solid var(--border);
-      border-radius: var(--radius);
-      padding: 22px 26px;
-      margin-bottom: 32px;
-    }
-    .qs-label { font-size: 12px; font-weight: 600; color: var(--sub); margin-bottom: 12px; }
-    .qs-cmd {
-      display: flex; align-items: center; justify-content: space-between; gap: 12px;
-      background: rgba(17, 17, 27, 0.8);
-      border: 1px solid var(--border);
-      border-radius: 8px;
-      padding: 12px 16px;
-      font-size: 13px; color: var(--mauve);
-      word-break: break-all;
-      margin-bottom: 8px;
-    }
-    .qs-note { font-size: 11px; color: var(--muted); }
-    .qs-note code { color: var(--blue); }
-
-    /* ── copy button ── */
-    .btn-copy {
-      flex-shrink: 0;
-      padding: 4px 12px;
-      border-radius: 5px;
-      border: 1px solid var(--border);
-      background: transparent;
-      color: var(--sub);
-      font-family: inherit; font-size: 10px;
-      cursor: pointer;
-      white-space: nowrap;
-      transition: background .15s, color .15s;
-    }
-    .btn-copy:hover { background: rgba(203, 166, 247, .1); color: var(--text); }
-
-    /* ── session card ── */
-    .card {
-      display: flex; align-items: center; gap: 16px;
-      background: var(--surface);
-      backdrop-filter: var(--blur);
-      border: 1px solid var(--border);
-      border-radius: var(--radius);
-      padding: 18px 22px;
-      margin-bottom: 10px;
-      transition: border-color .15s;
-    }
-    .card:hover { border-color: rgba(203, 166, 247, .4); }
-
-    .status-dot {
-      width: 10px; height: 10px; border-radius: 50%; flex-shrink: 0;
-    }
-    .status-dot.live { background: var(--green); box-shadow: 0 0 8px var(--green); }
-    .status-dot.dead { background: var(--red); }
-
-    .card-info    { flex: 1; }
-    .card-name    { font-size: 14px; font-weight: 600; color: var(--text); }
-    .card-sid     { font-size: 11px; color: var(--mauve); margin-top: 2px; }
-    .card-meta    { font-size: 11px; color: var(--muted); margin-top: 3px; }
-    .card-actions { display: flex; gap: 8px; }
-
-    /* ── buttons ── */
-    .btn {
-      display: inline-flex; align-items: center; gap: 5px;
-      padding: 6px 14px;
-      border-radius: 6px;
-      border: 1px solid var(--border);
-      background: transparent;
-      color: var(--sub);
-      font-family: inherit; font-size: 11px;
-      cursor: pointer; text-decoration: none;
-      transition: background .15s, color .15s, border-color .15s;
-    }
-    .btn:hover { background: rgba(203, 166, 247, .1); color: var(--text); border-color: var(--mauve); }
-    .btn-primary {
-      background: var(--mauve); color: #1e1e2e;
-      border: none; font-weight: 700;
-    }
-    .btn-primary:hover { filter: brightness(1.1); }
-
-    /* ── empty state ── */
-    .empty {
-      text-align: center; padding: 56px 24px;
-      color: var(--muted); font-size: 13px; line-height: 2.2;
-    }
-    .empty code { color: var(--mauve); font-size: 13px; }
-
-    /* ── footer ── */
-    #refresh-info { text-align: center; font-size: 11px; color: var(--muted); margin-top: 16px; }
-  </style>
-</head>
-<body>
-  <div id="bg"></div>
-
-  <main>
-    <div class="logo">⚡ HyprShare</div>
-    <p class="tagline">Self-hosted terminal sharing · sshx-compatible</p>
-
-    <!-- Quick-start -->
-    <div class="quickstart">
-      <div class="qs-label">🚀 Share any terminal — one command:</div>
-      <div class="qs-cmd">
-        <span id="one-liner">loading…</span>
-        <button class="btn-copy" onclick="copyOneLiner(event)">Copy</button>
-      </div>
-      <p class="qs-note">
-        Or install permanently:
-        <code>curl HOST/get | sh</code>
-        then run
-        <code>hyprshare --server HOST</code>
-      </p>
-    </div>
-
-    <!-- Sessions -->
-    <h2>Active Sessions</h2>
-    <div id="session-list"><div class="empty">⏳ Loading…</div></div>
-    <div id="refresh-info">Auto-refresh every 5 s</div>
-  </main>
-
-  <script>
-    const origin = location.origin;
-    document.getElementById("one-liner").textContent =
-      `curl -sSf ${origin}/get | sh -s run`;
-
-    // ── helpers ─────────────────────────────────────────────────────────────
-    function timeAgo(unixSec) {
-      const s = Math.floor(Date.now() / 1000 - unixSec);
-      if (s <    60) return `${s}s ago`;
-      if (s <  3600) return `${Math.floor(s / 60)}m ago`;
-      return `${Math.floor(s / 3600)}h ago`;
-    }
-
-    function copyText(text, btn, label = "Copy") {
-      navigator.clipboard.writeText(text);
-      btn.textContent = "✓ Copied";
-      setTimeout(() => btn.textContent = label, 1800);
-    }
-
-    function copyOneLiner(e) {
-      copyText(document.getElementById("one-liner").textContent, e.target);
-    }
-
-    function copyLink(sid, btn) {
-      copyText(`${origin}/s/${sid}`, btn, "⎘ Link");
-    }
-
-    // ── session list renderer ────────────────────────────────────────────────
-    function renderCard(s) {
-      const dot      = s.alive ? "live" : "dead";
-      const status   = s.alive ? "🟢 Live" : "🔴 Offline";
-      const viewers  = `${s.viewers} viewer${s.viewers !== 1 ? "s" : ""}`;
-      const openBtn  = s.alive
-        ? `<a class="btn btn-primary" href="/s/${s.id}" target="_blank">Open →</a>`
-        : "";
-      return `
-        <div class="card">
-          <div class="status-dot ${dot}"></div>
-          <div class="card-info">
-            <div class="card-name">${s.name}</div>
-            <div class="card-sid">sid: ${s.id}</div>
-            <div class="card-meta">${status} · ${viewers} · ${timeAgo(s.created)}</div>
-          </div>
-          <div class="card-actions">
-            ${openBtn}
-            <button class="btn" onclick="copyLink('${s.id}', this)">⎘ Link</button>
-          </div>
-        </div>`;
-    }
-
-    async function loadSessions() {
-      const { sessions } = await fetch("/api/sessions").then(r => r.json());
-      const list = document.getElementById("session-list");
-
-      if (!sessions.length) {
-        list.innerHTML = `<div class="empty">
-          No active sessions.<br>
-          Start one from any machine:<br>
-          <code>curl -sSf ${origin}/get | sh -s run</code>
-        </div>`;
-      } else {
-        list.innerHTML = sessions.map(renderCard).join("");
-      }
-
-      document.getElementById("refresh-info").textContent =
-        `Updated ${new Date().toLocaleTimeString()}`;
-    }
-
-    loadSessions();
-    setInterval(loadSessions, 5000);
-  </script>
-</body>
-</html>
-"""
-
+# Viewer template (per-session, so it stays a module-level constant;
+# the static dashboard lives in static/index.html)
 # ---------------------------------------------------------------------------
 
 _VIEWER_HTML = """\
@@ -968,18 +971,48 @@ _VIEWER_HTML = """\
     </div>
   </div>
 
+  <!-- Error card, cloned into the overlay by showError() -->
+  <template id="err-tpl">
+    <div class="overlay-box">
+      <div class="overlay-icon">⚠️</div>
+      <div class="overlay-title">Session Not Found</div>
+      <div class="overlay-sub"><span class="err-msg"></span><br><br>The session may have expired.</div>
+      <div class="overlay-code err-url"></div>
+      <button class="overlay-btn" onclick="location.reload()">Retry</button>
+    </div>
+  </template>
+
   <script>
     "use strict";
 
     // ── constants ────────────────────────────────────────────────────────────
     const SID     = "{{SID}}";
+    const FRAME_OUTPUT = 0x01;   // binary frame tag: raw PTY bytes follow
     const WS_URL  = `${location.protocol === "https:" ? "wss" : "ws"}://${location.host}/viewer/ws/${SID}`;
+    const SHARE_URL = location.href;
+
+    // ── DOM references (stable for the page's lifetime) ──────────────────────
+    const $overlay = document.getElementById("overlay");
+    const $errTpl  = document.getElementById("err-tpl");
+    const $sb      = document.getElementById("sb-info");
+    const $dot     = document.getElementById("status-dot");
+    const $lat     = document.getElementById("latency");
+    const $agent   = document.getElementById("agent-name");
+    const $title   = document.getElementById("window-title");
+    const $viewers = document.getElementById("viewer-count");
+    const $ro      = document.getElementById("ro-btn");
+    const $roBadge = document.getElementById("readonly-badge");
+    const $term    = document.getElementById("terminal");
 
     // ── state ────────────────────────────────────────────────────────────────
     let ws          = null;
     let readOnly    = false;
     let pingStart   = 0;
     let retryDelay  = 1000;
+    let pingTimer   = null;
+    let lastLatency = -1;
+    let lastName    = null;
+    let lastViewers = -1;
 
     // ── xterm.js setup ───────────────────────────────────────────────────────
     const term = new Terminal({
@@ -1010,8 +1043,12 @@ _VIEWER_HTML = """\
     const linksAddon = new WebLinksAddon.WebLinksAddon();
     term.loadAddon(fitAddon);
     term.loadAddon(linksAddon);
-    term.open(document.getElementById("terminal"));
-    setTimeout(() => { fitAddon.fit(); term.focus(); }, 100);
+    term.open($term);
+    // Two frames in, layout has settled: fit to it right away
+    requestAnimationFrame(() => requestAnimationFrame(() => {
+      fitAndSync();
+      term.focus();
+    }));
 
     // Forward user keystrokes to server (unless read-only)
     term.onData(data => {
@@ -1027,33 +1064,115 @@ _VIEWER_HTML = """\
       }
     }
 
-    new ResizeObserver(() => setTimeout(() => { fitAddon.fit(); sendResize(); }, 50))
-      .observe(document.getElementById("terminal"));
-    window.addEventListener("resize", () => { fitAddon.fit(); sendResize(); });
+    // Fit at most once per frame, and only tell the server when the grid changed
+    let fitPending = false;
+    let lastCols   = -1;
+    let lastRows   = -1;
+
+    function fitAndSync() {
+      fitAddon.fit();
+      if (term.cols !== lastCols || term.rows !== lastRows) {
+        lastCols = term.cols;
+        lastRows = term.rows;
+        sendResize();
+      }
+    }
+
+    function scheduleFit() {
+      if (fitPending) return;
+      fitPending = true;
+      requestAnimationFrame(() => {
+        fitPending = false;
+        fitAndSync();
+      });
+    }
+
+    // #terminal tracks the viewport, so this also covers window resizes
+    new ResizeObserver(scheduleFit).observe($term);
+
+    // ── Output batching ──────────────────────────────────────────────────────
+    // Everything bound for the terminal is appended to a reusable byte
+    // buffer (doubling when full) and handed to xterm in a single write per
+    // animation frame. xterm parses asynchronously, so while one buffer is
+    // lent to a pending term.write the next frame fills the other one.
+    const OUT_MIN    = 64 * 1024;
+    const encoder    = new TextEncoder();
+    let outBuf       = new Uint8Array(OUT_MIN);
+    let outSpare     = new Uint8Array(OUT_MIN);   // free buffer to switch to
+    let outLen       = 0;
+    let outLent      = false;   // outBuf still referenced by a pending term.write
+    let outScheduled = false;
+
+    function enqueueOutput(data) {
+      const chunk = typeof data === "string" ? encoder.encode(data) : data;
+      if (outLent) {
+        // Both buffers in flight only if xterm is two frames behind
+        outBuf   = outSpare ?? new Uint8Array(OUT_MIN);
+        outSpare = null;
+        outLent  = false;
+      }
+      if (outLen + chunk.length > outBuf.length) {
+        let cap = outBuf.length * 2;
+        while (cap < outLen + chunk.length) cap *= 2;
+        const grown = new Uint8Array(cap);
+        grown.set(outBuf.subarray(0, outLen));
+        outBuf = grown;
+      }
+      outBuf.set(chunk, outLen);
+      outLen += chunk.length;
+      if (!outScheduled) {
+        outScheduled = true;
+        requestAnimationFrame(flushOutput);
+      }
+    }
+
+    function flushOutput() {
+      outScheduled = false;
+      if (!outLen) return;
+      const lent = outBuf;
+      const n    = outLen;
+      outLent = true;
+      outLen  = 0;
+      term.write(lent.subarray(0, n), () => {
+        if (outBuf === lent) outLent = false;
+        else outSpare = lent;
+      });
+    }
 
     // ── WebSocket connection ─────────────────────────────────────────────────
     function connect() {
       setStatus("connecting");
-      document.getElementById("overlay").classList.remove("hidden");
+      $overlay.classList.remove("hidden");
 
       ws = new WebSocket(WS_URL);
+      ws.binaryType = "arraybuffer";
 
       ws.onopen = () => {
-        retryDelay = 1000;
-        document.getElementById("overlay").classList.add("hidden");
+        retryDelay = 500 + Math.random() * 1000;   // desync peers from the start
+        $overlay.classList.add("hidden");
         setStatus("live");
-        document.getElementById("sb-info").textContent = `live · ${SID}`;
+        setText($sb, `live · ${SID}`);
         sendResize();
         schedulePing();
       };
 
-      ws.onmessage = ({ data }) => handleMessage(JSON.parse(data));
+      ws.onmessage = ({ data }) => {
+        if (typeof data === "string") {
+          handleMessage(JSON.parse(data));
+          return;
+        }
+        const bytes = new Uint8Array(data);
+        if (bytes[0] === FRAME_OUTPUT) enqueueOutput(bytes.subarray(1));
+      };
 
       ws.onclose = () => {
+        stopPing();
         setStatus("dead");
-        document.getElementById("sb-info").textContent = "reconnecting…";
-        setTimeout(connect, retryDelay);
-        retryDelay = Math.min(retryDelay * 1.5, 10_000);
+        setText($sb, "reconnecting…");
+        // Full jitter so viewers don't reconnect in lockstep after a restart
+        const cap = Math.min(retryDelay * 1.5, 10_000);
+        setTimeout(connect, Math.random() * cap);
+        retryDelay = cap;
       };
 
       ws.onerror = () => ws.close();
@@ -1062,24 +1181,33 @@ _VIEWER_HTML = """\
     function handleMessage(msg) {
       switch (msg.type) {
         case "output":
-          term.write(msg.data);
+          enqueueOutput(msg.data);
           break;
 
-        case "pong":
-          document.getElementById("latency").textContent = `${Date.now() - pingStart} ms`;
+        case "pong": {
+          const ms = Date.now() - pingStart;
+          if (ms !== lastLatency) {
+            lastLatency = ms;
+            $lat.textContent = `${ms} ms`;
+          }
           break;
+        }
 
         case "meta":
-          document.getElementById("agent-name").textContent  = msg.name || SID;
-          document.getElementById("window-title").textContent = `${msg.name} — HyprShare · ${SID}`;
-          document.getElementById("viewer-count").textContent =
-            `${msg.viewers} viewer${msg.viewers !== 1 ? "s" : ""}`;
+          if (msg.name === lastName && msg.viewers === lastViewers) break;
+          if (msg.name !== lastName) {
+            lastName = msg.name;
+            setText($agent, msg.name || SID);
+            setText($title, `${msg.name} — HyprShare · ${SID}`);
+          }
+          lastViewers = msg.viewers;
+          setText($viewers, `${msg.viewers} viewer${msg.viewers !== 1 ? "s" : ""}`);
           break;
 
         case "disconnect":
-          term.write(`\\r\\n\\x1b[33m[HyprShare] ${msg.message}\\x1b[0m\\r\\n`);
+          enqueueOutput(`\\r\\n\\x1b[33m[HyprShare] ${msg.message}\\x1b[0m\\r\\n`);
           setStatus("dead");
-          document.getElementById("sb-info").textContent = "agent offline";
+          setText($sb, "agent offline");
           break;
 
         case "error":
@@ -1088,8 +1216,10 @@ _VIEWER_HTML = """\
       }
     }
 
+    // One ping interval at a time, whatever the number of reconnects
     function schedulePing() {
-      setInterval(() => {
+      if (pingTimer) return;
+      pingTimer = setInterval(() => {
         if (ws?.readyState === WebSocket.OPEN) {
           pingStart = Date.now();
           ws.send(JSON.stringify({ type: "ping" }));
@@ -1097,26 +1227,38 @@ _VIEWER_HTML = """\
       }, 5000);
     }
 
+    function stopPing() {
+      clearInterval(pingTimer);
+      pingTimer = null;
+    }
+
+    // No latency probes from a background tab
+    document.addEventListener("visibilitychange", () => {
+      if (document.hidden) stopPing();
+      else if (ws?.readyState === WebSocket.OPEN) schedulePing();
+    });
+
     // ── UI helpers ───────────────────────────────────────────────────────────
+    // Skip writes that would not change anything (they still dirty the node)
+    function setText(el, text) {
+      if (el.textContent !== text) el.textContent = text;
+    }
+
     function setStatus(state) {
-      document.getElementById("status-dot").className = `dot ${state}`;
+      const cls = `dot ${state}`;
+      if ($dot.className !== cls) $dot.className = cls;
     }
 
     function showError(message) {
-      const overlay = document.getElementById("overlay");
-      overlay.classList.remove("hidden");
-      overlay.innerHTML = `
-        <div class="overlay-box">
-          <div class="overlay-icon">⚠️</div>
-          <div class="overlay-title">Session Not Found</div>
-          <div class="overlay-sub">${message}<br><br>The session may have expired.</div>
-          <div class="overlay-code">${location.href}</div>
-          <button class="overlay-btn" onclick="location.reload()">Retry</button>
-        </div>`;
+      const card = $errTpl.content.cloneNode(true);
+      card.querySelector(".err-msg").textContent = message;
+      card.querySelector(".err-url").textContent = SHARE_URL;
+      $overlay.replaceChildren(card);
+      $overlay.classList.remove("hidden");
     }
 
     function copyUrl(event) {
-      navigator.clipboard.writeText(location.href);
+      navigator.clipboard.writeText(SHARE_URL);
       const btn = event.target;
       btn.textContent = "✓ Copied!";
       setTimeout(() => btn.textContent = "⎘ Copy URL", 2000);
@@ -1124,70 +1266,184 @@ _VIEWER_HTML = """\
 
     function toggleReadOnly() {
       readOnly = !readOnly;
-      document.getElementById("ro-btn").textContent       = readOnly ? "✏️ Read-write" : "🔒 Read-only";
-      document.getElementById("readonly-badge").style.display = readOnly ? "inline-flex" : "none";
+      $ro.textContent           = readOnly ? "✏️ Read-write" : "🔒 Read-only";
+      $roBadge.style.display    = readOnly ? "inline-flex" : "none";
       term.options.cursorBlink = !readOnly;
     }
 
     // ── Particle wallpaper ───────────────────────────────────────────────────
-    (function initParticles() {
-      const canvas  = document.getElementById("wp-canvas");
-      const ctx     = canvas.getContext("2d");
+    // Self-contained (no DOM access) so the same source can run in a worker
+    // on an OffscreenCanvas. Returns { resize, start, stop }.
+    function particleWallpaper(canvas, width, height) {
+      const ctx      = canvas.getContext("2d");
+      const LINK     = 110;             // max edge length, also the grid cell size
+      const LINK2    = LINK * LINK;
+      const INV_LINK = 1 / LINK;
+      const TAU      = Math.PI * 2;
+
+      // Edge opacity is quantised so all edges of one bucket share a stroke
+      const BUCKETS     = 8;
+      const edgeStyles  = Array.from({ length: BUCKETS },
+        (_, k) => `rgba(160, 130, 240, ${((k + .5) / BUCKETS) * .22})`);
+
+      // Uniform grid of LINK-sized cells: edges only need the 3×3 neighbourhood
+      let gridCols = 1, gridRows = 1, grid = [[]];
+
+      // Deliberately CSS-pixel sized (DPR = 1): the soft, fading particles
+      // gain nothing from a devicePixelRatio backing store, which would cost
+      // DPR² times the fill work.
+      function resize(w, h) {
+        canvas.width  = w;
+        canvas.height = h;
+        gridCols = Math.max(1, Math.ceil(canvas.width  / LINK));
+        gridRows = Math.max(1, Math.ceil(canvas.height / LINK));
+        grid     = Array.from({ length: gridCols * gridRows }, () => []);
+      }
 
-      function resize() {
-        canvas.width  = window.innerWidth;
-        canvas.height = window.innerHeight;
+      resize(width, height);
+
+      const COUNT     = 90;
+      const cellX     = new Int32Array(COUNT);   // grid cell of each particle
+      const cellY     = new Int32Array(COUNT);
+
+      // Particle state as parallel typed arrays (structure of arrays)
+      const px    = new Float32Array(COUNT);
+      const py    = new Float32Array(COUNT);
+      const pvx   = new Float32Array(COUNT);
+      const pvy   = new Float32Array(COUNT);
+      const pr    = new Float32Array(COUNT);
+      const pfill = new Array(COUNT);       // hues never change: fill built once
+
+      for (let i = 0; i < COUNT; i++) {
+        px[i]  = Math.random() * canvas.width;
+        py[i]  = Math.random() * canvas.height;
+        pvx[i] = (Math.random() - .5) * .35;
+        pvy[i] = (Math.random() - .5) * .35;
+        pr[i]  = Math.random() * 1.8 + .4;
+        pfill[i] = `hsla(${(Math.random() * 60 + 240) | 0}, 72%, 68%, .75)`;
       }
-      resize();
-      window.addEventListener("resize", resize);
-
-      const particles = Array.from({ length: 90 }, () => ({
-        x:  Math.random() * canvas.width,
-        y:  Math.random() * canvas.height,
-        vx: (Math.random() - .5) * .35,
-        vy: (Math.random() - .5) * .35,
-        r:  Math.random() * 1.8 + .4,
-        h:  Math.random() * 60 + 240,
-      }));
-
-      function drawFrame() {
+
+      // Capped at 30 FPS whatever the display rate; the trail fade hides it
+      const FRAME_MS = 1000 / 30;
+      let lastFrame = 0;
+
+      // Workers without requestAnimationFrame fall back to a timer
+      const raf = self.requestAnimationFrame?.bind(self)
+        ?? (cb => setTimeout(() => cb(performance.now()), FRAME_MS));
+      const caf = self.cancelAnimationFrame?.bind(self) ?? clearTimeout;
+
+      function drawFrame(ts) {
+        rafId = raf(drawFrame);
+        if (ts - lastFrame < FRAME_MS) return;
+        lastFrame = ts - (ts - lastFrame) % FRAME_MS;   // keep the cadence on 60 Hz vsync
+
+        const w = canvas.width, h = canvas.height;
+        const cols = gridCols, rows = gridRows;
+
         ctx.fillStyle = "rgba(13, 13, 26, .1)";
-        ctx.fillRect(0, 0, canvas.width, canvas.height);
+        ctx.fillRect(0, 0, w, h);
 
-        for (const p of particles) {
-          p.x += p.vx;  p.y += p.vy;
-          if (p.x < 0 || p.x > canvas.width)  p.vx *= -1;
-          if (p.y < 0 || p.y > canvas.height)  p.vy *= -1;
+        for (let i = 0; i < COUNT; i++) {
+          px[i] += pvx[i];  py[i] += pvy[i];
+          if (px[i] < 0 || px[i] > w)  pvx[i] = -pvx[i];
+          if (py[i] < 0 || py[i] > h)  pvy[i] = -pvy[i];
 
           ctx.beginPath();
-          ctx.arc(p.x, p.y, p.r, 0, Math.PI * 2);
-          ctx.fillStyle = `hsla(${p.h}, 72%, 68%, .75)`;
+          ctx.arc(px[i], py[i], pr[i], 0, TAU);
+          ctx.fillStyle = pfill[i];
           ctx.fill();
         }
 
-        // Draw edges between close particles
-        for (let i = 0; i < particles.length; i++) {
-          for (let j = i + 1; j < particles.length; j++) {
-            const dx = particles[i].x - particles[j].x;
-            const dy = particles[i].y - particles[j].y;
-            const dist = Math.sqrt(dx * dx + dy * dy);
-            if (dist < 110) {
-              ctx.strokeStyle = `rgba(160, 130, 240, ${(1 - dist / 110) * .22})`;
-              ctx.lineWidth   = .5;
-              ctx.beginPath();
-              ctx.moveTo(particles[i].x, particles[i].y);
-              ctx.lineTo(particles[j].x, particles[j].y);
-              ctx.stroke();
+        // Bucket particles into grid cells
+        for (const cell of grid) cell.length = 0;
+        for (let i = 0; i < COUNT; i++) {
+          const cx = Math.min(cols - 1, Math.max(0, Math.floor(px[i] * INV_LINK)));
+          const cy = Math.min(rows - 1, Math.max(0, Math.floor(py[i] * INV_LINK)));
+          cellX[i] = cx;  cellY[i] = cy;
+          grid[cy * cols + cx].push(i);
+        }
+
+        // Collect edges between close particles (neighbouring cells only)
+        const paths = Array.from({ length: BUCKETS }, () => new Path2D());
+        for (let i = 0; i < COUNT; i++) {
+          const ax = px[i], ay = py[i];
+          const cx = cellX[i], cy = cellY[i];
+          const y1 = Math.min(rows - 1, cy + 1), x1 = Math.min(cols - 1, cx + 1);
+          for (let ny = Math.max(0, cy - 1); ny <= y1; ny++) {
+            for (let nx = Math.max(0, cx - 1); nx <= x1; nx++) {
+              for (const j of grid[ny * cols + nx]) {
+                if (j <= i) continue;
+                const dx = ax - px[j];
+                const dy = ay - py[j];
+                const d2 = dx * dx + dy * dy;
+                if (d2 < LINK2) {
+                  const k = Math.min(BUCKETS - 1, ((1 - Math.sqrt(d2) * INV_LINK) * BUCKETS) | 0);
+                  paths[k].moveTo(ax, ay);
+                  paths[k].lineTo(px[j], py[j]);
+                }
+              }
             }
           }
         }
 
-        requestAnimationFrame(drawFrame);
+        // One stroke per opacity bucket
+        ctx.lineWidth = .5;
+        for (let k = 0; k < BUCKETS; k++) {
+          ctx.strokeStyle = edgeStyles[k];
+          ctx.stroke(paths[k]);
+        }
+      }
+
+      let rafId = null;
+      function start() {
+        if (!rafId) rafId = raf(drawFrame);
+      }
+      function stop() {
+        if (rafId) { caf(rafId); rafId = null; }
       }
 
       ctx.fillStyle = "#0d0d1a";
       ctx.fillRect(0, 0, canvas.width, canvas.height);
-      drawFrame();
+      return { resize, start, stop };
+    }
+
+    (function initParticles() {
+      // Respect the OS setting: no animation loop at all
+      if (matchMedia("(prefers-reduced-motion: reduce)").matches) return;
+
+      const canvas = document.getElementById("wp-canvas");
+      let wp;
+
+      if ("transferControlToOffscreen" in HTMLCanvasElement.prototype) {
+        // Draw off the main thread so the wallpaper never competes with xterm
+        const source = `"use strict";
+          ${particleWallpaper}
+          let wp;
+          self.onmessage = ({ data }) => {
+            if (data.canvas) wp = particleWallpaper(data.canvas, data.w, data.h);
+            else wp[data.call](...data.args);
+          };`;
+        const worker = new Worker(URL.createObjectURL(new Blob([source], { type: "text/javascript" })));
+        const off    = canvas.transferControlToOffscreen();
+        worker.postMessage({ canvas: off, w: innerWidth, h: innerHeight }, [off]);
+        wp = {
+          resize: (w, h) => worker.postMessage({ call: "resize", args: [w, h] }),
+          start:  ()     => worker.postMessage({ call: "start",  args: [] }),
+          stop:   ()     => worker.postMessage({ call: "stop",   args: [] }),
+        };
+      } else {
+        wp = particleWallpaper(canvas, innerWidth, innerHeight);
+      }
+
+      // Only animate while the wallpaper can actually be seen
+      const start = () => { if (!document.hidden) wp.start(); };
+
+      window.addEventListener("resize", () => wp.resize(innerWidth, innerHeight));
+      document.addEventListener("visibilitychange", () => document.hidden ? wp.stop() : start());
+      if ("IntersectionObserver" in window)
+        new IntersectionObserver(([e]) => e.isIntersecting ? start() : wp.stop()).observe(canvas);
+
+      start();
     })();
 
     // ── boot ─────────────────────────────────────────────────────────────────
@@ -1201,6 +1457,49 @@ _VIEWER_HTML = """\
 # Entry point
 # ---------------------------------------------------------------------------
 
+# Rows of the startup box (None draws a divider); the frame widens to fit
+BANNER_ROWS = (
+    "            ⚡  HyprShare  v1.0",
+    None,
+    "  Dashboard   →  {dashboard}",
+    "",
+    "  Share a terminal from any machine:",
+    "  {install}",
+)
+BANNER_MIN_WIDTH = 54
+
+
+def _cells(text: str) -> int:
+    """Terminal columns taken by text (wide glyphs such as ⚡ count twice)."""
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def render_banner(**fields: str) -> str:
+    """Fill BANNER_ROWS in and box them, widening the box for long values."""
+    rows  = [row if row is None else row.format(**fields) for row in BANNER_ROWS]
+    width = max([BANNER_MIN_WIDTH] + [_cells(r) + 2 for r in rows if r is not None])
+    lines = ["╔" + "═" * width + "╗"]
+    for row in rows:
+        if row is None:
+            lines.append("╠" + "═" * width + "╣")
+        else:
+            lines.append("║" + row + " " * (width - _cells(row)) + "║")
+    lines.append("╚" + "═" * width + "╝")
+    return "\n" + "\n".join(lines) + "\n"
+
+
+def get_local_ip() -> str:
+    """LAN address of this host, or 127.0.0.1 if it cannot be found quickly."""
+    try:
+        # connect() on a UDP socket sends nothing; it only picks a route
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.1)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="HyprShare — self-hosted terminal sharing server",
@@ -1210,33 +1509,24 @@ if __name__ == "__main__":
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload (dev mode)")
     args = parser.parse_args()
 
-    # Get the local IP address
-    try:
-        # Try to get the local IP by connecting to an external socket
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-    except Exception:
-        # Fallback to hostname
-        local_ip = socket.gethostbyname(socket.gethostname())
-
-    print(f"""
-╔══════════════════════════════════════════════════════╗
-║            ⚡  HyprShare  v1.0                       ║
-╠══════════════════════════════════════════════════════╣
-║  Dashboard   →  http://localhost:{args.port}/               ║
-║                                                      ║
-║  Share a terminal from any machine:                  ║
-║  curl -sSf http://{local_ip}:{args.port}/get | sh -s run  ║
-╚══════════════════════════════════════════════════════╝
-""")
+    if sys.stdout.isatty():
+        print(render_banner(
+            dashboard=f"http://localhost:{args.port}/",
+            install=f"curl -sSf http://{get_local_ip()}:{args.port}/get | sh -s run",
+        ))
+    else:
+        print(f"HyprShare listening on {args.host}:{args.port}")
 
+    # The import string is only needed for the reloader; otherwise hand over
+    # this module's app directly and skip the re-import
     uvicorn.run(
-        "server:app",
+        "server:app" if args.reload else app,
         host=args.host,
         port=args.port,
         reload=args.reload,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         ws_ping_interval=20,
         ws_ping_timeout=10,
+        ws_per_message_deflate=True,   # terminal output compresses very well
     )
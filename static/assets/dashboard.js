@@ -0,0 +1,69 @@
+const origin = location.origin;
+document.getElementById("one-liner").textContent =
+  `curl -sSf ${origin}/get | sh -s run`;
+
+// ── helpers ─────────────────────────────────────────────────────────────
+function timeAgo(unixSec) {
+  const s = Math.floor(Date.now() / 1000 - unixSec);
+  if (s <    60) return `${s}s ago`;
+  if (s <  3600) return `${Math.floor(s / 60)}m ago`;
+  return `${Math.floor(s / 3600)}h ago`;
+}
+
+function copyText(text, btn, label = "Copy") {
+  navigator.clipboard.writeText(text);
+  btn.textContent = "✓ Copied";
+  setTimeout(() => btn.textContent = label, 1800);
+}
+
+function copyOneLiner(e) {
+  copyText(document.getElementById("one-liner").textContent, e.target);
+}
+
+function copyLink(sid, btn) {
+  copyText(`${origin}/s/${sid}`, btn, "⎘ Link");
+}
+
+// ── session list renderer ────────────────────────────────────────────────
+function renderCard(s) {
+  const dot      = s.alive ? "live" : "dead";
+  const status   = s.alive ? "🟢 Live" : "🔴 Offline";
+  const viewers  = `${s.viewers} viewer${s.viewers !== 1 ? "s" : ""}`;
+  const openBtn  = s.alive
+    ? `<a class="btn btn-primary" href="/s/${s.id}" target="_blank">Open →</a>`
+    : "";
+  return `
+    <div class="card">
+      <div class="status-dot ${dot}"></div>
+      <div class="card-info">
+        <div class="card-name">${s.name}</div>
+        <div class="card-sid">sid: ${s.id}</div>
+        <div class="card-meta">${status} · ${viewers} · ${timeAgo(s.created)}</div>
+      </div>
+      <div class="card-actions">
+        ${openBtn}
+        <button class="btn" onclick="copyLink('${s.id}', this)">⎘ Link</button>
+      </div>
+    </div>`;
+}
+
+async function loadSessions() {
+  const { sessions } = await fetch("/api/sessions").then(r => r.json());
+  const list = document.getElementById("session-list");
+
+  if (!sessions.length) {
+    list.innerHTML = `<div class="empty">
+      No active sessions.<br>
+      Start one from any machine:<br>
+      <code>curl -sSf ${origin}/get | sh -s run</code>
+    </div>`;
+  } else {
+    list.innerHTML = sessions.map(renderCard).join("");
+  }
+
+  document.getElementById("refresh-info").textContent =
+    `Updated ${new Date().toLocaleTimeString()}`;
+}
+
+loadSessions();
+setInterval(loadSessions, 5000);
@@ -0,0 +1,47 @@
+import asyncio
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+
+class SlowViewer:
+    """Stands in for a viewer WebSocket whose sends take a while."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.frames: list[bytes] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        await asyncio.sleep(self.delay)
+        self.frames.append(data)
+
+
+class QueueOutputTest(unittest.IsolatedAsyncioTestCase):
+    async def test_output_queued_during_broadcast_is_flushed(self) -> None:
+        sess = server.Session(id="t", name="t", created=0.0)
+        viewer = SlowViewer(0.01)
+        sess.add_viewer(viewer)
+
+        await sess.queue_output(b"first")
+        await asyncio.sleep(0.005)             # first flush is now mid-send
+        await sess.queue_output(b"second")
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(b"".join(viewer.frames),
+                         server.FRAME_OUTPUT + b"first" + server.FRAME_OUTPUT + b"second")
+        self.assertEqual(sess.pending, b"")
+
+
+class ParseJsonTest(unittest.TestCase):
+    def test_only_objects_are_accepted(self) -> None:
+        self.assertEqual(server._parse_json('{"type": "ping"}'), {"type": "ping"})
+        for raw in ("[1, 2]", '"ping"', "42", "null", "not json"):
+            self.assertIsNone(server._parse_json(raw), raw)
+
+
+if __name__ == "__main__":
+    unittest.main()